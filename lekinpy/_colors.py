@@ -0,0 +1,30 @@
+''' Shared color palette for jobs and workcenters created without an explicit rgb. '''
+import random
+import threading
+from typing import List, Optional, Tuple
+
+# Built by _palette() on first use so importing lekinpy does not load numpy
+_PALETTE: Optional[Tuple[Tuple[int, int, int], ...]] = None
+
+# Shuffled copy of the palette, filled on first use and refilled when exhausted.
+_pool: List[Tuple[int, int, int]] = []
+_lock = threading.Lock()
+
+def _palette() -> Tuple[Tuple[int, int, int], ...]:
+    ''' All 4x4x4 combinations of channel levels 0/64/128/192, red varying slowest. '''
+    global _PALETTE
+    if _PALETTE is None:
+        import numpy as np
+
+        palette_arr = np.stack(
+            np.meshgrid(*[np.arange(0, 256, 64)] * 3, indexing='ij'), axis=-1
+        ).reshape(-1, 3)
+        _PALETTE = tuple(tuple(row) for row in palette_arr.tolist())
+    return _PALETTE
+
+def next_color() -> Tuple[int, int, int]:
+    with _lock:
+        if not _pool:
+            _pool.extend(_palette())
+            random.shuffle(_pool)
+        return _pool.pop()
@@ -0,0 +1,6 @@
+''' Package-wide runtime switches. '''
+
+# Run the isinstance checks in Job/Operation/Machine/Workcenter constructors.
+# Follows `__debug__`, so checks are on by default and skipped under `python -O`.
+# Set `lekinpy._config.VALIDATE = False` to skip them when bulk-loading trusted data.
+VALIDATE: bool = __debug__
@@ -0,0 +1,96 @@
+"""
+Array-based kernels for the scheduling engines.
+
+The kernels are plain Python functions written in a numba-compatible subset.
+`compiled_dynamic_schedule_kernel()` compiles them with ``@njit`` when numba is
+installed (``pip install lekinpy[jit]``). numba is imported only on that first
+call, so ``import lekinpy`` never pays for it.
+"""
+import numpy as np
+
+# None: not tried yet; False: numba unavailable; otherwise the compiled kernel
+_compiled_kernel = None
+
+
+def compiled_dynamic_schedule_kernel():
+    """
+    Returns `dynamic_schedule_kernel` compiled with numba, or None if numba is not installed.
+    """
+    global _compiled_kernel
+    if _compiled_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional
+            _compiled_kernel = False
+        else:
+            _compiled_kernel = njit(cache=True)(dynamic_schedule_kernel)
+    return _compiled_kernel or None
+
+
+def dynamic_schedule_kernel(release, key, processing_time, job_wc, wc_ptr, wc_machines, machine_avail):
+    """
+    Array version of `SchedulingAlgorithm.dynamic_schedule`.
+
+    Arguments (one entry per job unless noted):
+        release: release times
+        key: value the selection rule minimises (ties go to the lower job index)
+        processing_time: processing time of the job's first operation
+        job_wc: index of the workcenter of the job's first operation
+        wc_ptr, wc_machines: machines of workcenter w are wc_machines[wc_ptr[w]:wc_ptr[w + 1]]
+        machine_avail: per-machine availability, updated in place
+
+    Returns (order, assigned_machine, start, end), all indexed by scheduling step.
+    """
+    n_jobs = release.shape[0]
+    n_machines = machine_avail.shape[0]
+    scheduled = np.zeros(n_jobs, dtype=np.bool_)
+    order = np.empty(n_jobs, dtype=np.int64)
+    assigned_machine = np.empty(n_jobs, dtype=np.int64)
+    start = np.empty(n_jobs, dtype=np.float64)
+    end = np.empty(n_jobs, dtype=np.float64)
+
+    step = 0
+    while step < n_jobs:
+        # Current simulation time is the earliest machine availability
+        earliest_machine = 0
+        current_time = machine_avail[0]
+        for m in range(1, n_machines):
+            if machine_avail[m] < current_time:
+                current_time = machine_avail[m]
+                earliest_machine = m
+
+        # Pick the released job with the smallest key
+        best = -1
+        for j in range(n_jobs):
+            if not scheduled[j] and release[j] <= current_time:
+                if best == -1 or key[j] < key[best]:
+                    best = j
+
+        # Nothing released yet: fast forward the earliest machine to the next release
+        if best == -1:
+            next_release = np.inf
+            for j in range(n_jobs):
+                if not scheduled[j] and release[j] < next_release:
+                    next_release = release[j]
+            machine_avail[earliest_machine] = next_release
+            continue
+
+        # Earliest available machine of the job's workcenter
+        wc = job_wc[best]
+        chosen = wc_machines[wc_ptr[wc]]
+        for p in range(wc_ptr[wc] + 1, wc_ptr[wc + 1]):
+            if machine_avail[wc_machines[p]] < machine_avail[chosen]:
+                chosen = wc_machines[p]
+
+        start_time = max(release[best], machine_avail[chosen])
+        end_time = start_time + processing_time[best]
+        machine_avail[chosen] = end_time
+
+        scheduled[best] = True
+        order[step] = best
+        assigned_machine[step] = chosen
+        start[step] = start_time
+        end[step] = end_time
+        step += 1
+
+    return order, assigned_machine, start, end
@@ -7,6 +7,10 @@ class SchedulingAlgorithm:
     tracking availability, and dynamic scheduling.
     """
 
+    # Below this many jobs the Python loop finishes before numba could even load the
+    # cached kernel, so dynamic_schedule only takes the compiled path from here up
+    compiled_min_jobs = 2000
+
     def __init__(self):
         # Maps each machine's name to its corresponding workcenter name
         self.machine_workcenter_map = {}
@@ -36,11 +40,12 @@ class SchedulingAlgorithm:
             for machine in system.machines
         }
 
-        # If system has workcenters, map each machine to its workcenter
+        # If system has workcenters, map each machine to its workcenter using the system's index
         if hasattr(system, 'workcenters'):
-            for workcenter in getattr(system, 'workcenters', []):
-                for machine in workcenter.machines:
-                    self.machine_workcenter_map[machine.name] = workcenter.name
+            self.machine_workcenter_map = {
+                machine.name: system.workcenter_for(machine.name)
+                for machine in system.machines
+            }
         else:
             # If workcenters aren't explicitly defined, use machine name as default workcenter name
             for machine in system.machines:
@@ -50,11 +55,7 @@ class SchedulingAlgorithm:
         """
         Returns list of machines belonging to a given workcenter.
         """
-        return [
-            machine
-            for machine in system.machines
-            if self.machine_workcenter_map.get(machine.name) == workcenter_name
-        ]
+        return system.machines_for(workcenter_name)
 
     def _get_earliest_machine(self, machines):
         """
@@ -136,19 +137,27 @@ class SchedulingAlgorithm:
             ))
         return machines
 
-    def dynamic_schedule(self, system, job_selector_fn):
+    def dynamic_schedule(self, system, job_selector_fn, job_key=None):
         """
         Generic dynamic scheduling engine.
 
         Arguments:
             system: scheduling system with jobs and machines
             job_selector_fn: function that selects the next job to schedule from a list of available jobs
+            job_key: optional function mapping a job to the number job_selector_fn minimises.
+                When given, numba is installed and the system has at least `compiled_min_jobs`
+                jobs, the loop runs as a compiled kernel instead.
 
         This function loops over time, selecting and assigning jobs dynamically as they become available.
         """
         # Prepare all internal states
         self.prepare(system)
 
+        if job_key is not None and len(system.jobs) >= self.compiled_min_jobs:
+            result = self._dynamic_schedule_compiled(system, job_key)
+            if result is not None:
+                return result
+
         # Track all unscheduled jobs by job_id
         unscheduled_jobs = {job.job_id: job for job in system.jobs}
 
@@ -196,4 +205,75 @@ class SchedulingAlgorithm:
         # After all jobs are scheduled, prepare the schedule summary
         machines = self.get_machine_schedules(system)
         total_time = max(self.machine_available_time.values()) if self.machine_available_time else 0
-        return total_time, machines
\ No newline at end of file
+        return total_time, machines
+
+    def _dynamic_schedule_compiled(self, system, job_key):
+        """
+        Runs `dynamic_schedule` through `_kernels.dynamic_schedule_kernel` on arrays
+        projected from the system, then writes the results back onto jobs and machines.
+
+        Returns None when numba is not installed or the system does not fit the
+        array model (duplicate ids, jobs without operations, workcenters without
+        machines) so the caller can fall back to the Python loop, which reports
+        those cases itself.
+        """
+        # Imported here so numpy and the kernels module load only for large systems
+        import numpy as np
+        from . import _kernels
+
+        kernel = _kernels.compiled_dynamic_schedule_kernel()
+        if kernel is None:
+            return None
+        jobs = system.jobs
+        machines = system.machines
+        machine_names = list(self.machine_available_time)
+        if not jobs or len(machine_names) != len(machines):
+            return None
+        if len({job.job_id for job in jobs}) != len(jobs):
+            return None
+        machine_index = {name: i for i, name in enumerate(machine_names)}
+
+        # Workcenter -> machine indices in CSR form, numbered in order of first use
+        wc_index = {}
+        wc_ptr = [0]
+        wc_machines = []
+        job_wc = np.empty(len(jobs), dtype=np.int64)
+        for j, job in enumerate(jobs):
+            if not job.operations:
+                return None
+            name = job.operations[0].workcenter
+            if name not in wc_index:
+                candidates = self._get_machines_for_workcenter(system, name)
+                if not candidates:
+                    return None
+                wc_index[name] = len(wc_index)
+                wc_machines.extend(machine_index[m.name] for m in candidates)
+                wc_ptr.append(len(wc_machines))
+            job_wc[j] = wc_index[name]
+
+        release = np.fromiter((job.release for job in jobs), dtype=np.float64, count=len(jobs))
+        key = np.fromiter((job_key(job) for job in jobs), dtype=np.float64, count=len(jobs))
+        processing_time = np.fromiter(
+            (job.operations[0].processing_time for job in jobs), dtype=np.float64, count=len(jobs)
+        )
+        machine_avail = np.fromiter(self.machine_available_time.values(), dtype=np.float64, count=len(machine_names))
+
+        order, assigned_machine, start, end = kernel(
+            release, key, processing_time, job_wc,
+            np.array(wc_ptr, dtype=np.int64), np.array(wc_machines, dtype=np.int64), machine_avail
+        )
+
+        # Apply the kernel's decisions in scheduling order
+        for j, m, start_time, end_time in zip(order.tolist(), assigned_machine.tolist(), start.tolist(), end.tolist()):
+            job = jobs[j]
+            op = job.operations[0]
+            op.start_time = start_time
+            op.end_time = end_time
+            job.start_time = start_time
+            job.end_time = end_time
+            self.machine_job_map[machine_names[m]].append(job.job_id)
+        self.machine_available_time = dict(zip(machine_names, machine_avail.tolist()))
+
+        machines_schedules = self.get_machine_schedules(system)
+        total_time = max(self.machine_available_time.values())
+        return total_time, machines_schedules
@@ -1,15 +1,19 @@
+from operator import attrgetter
+
 from .base import SchedulingAlgorithm
 from ..schedule import Schedule
 
 class EDDAlgorithm(SchedulingAlgorithm):
     ''' earliest due date '''
     def schedule(self, system):
+        due_key = attrgetter('due')
+
         def edd_selector_function(jobs):
             """
             Custom EDD selection function that calculates the EDD value for a job.
             """
-            return min(jobs, key=lambda job: job.due)
+            return min(jobs, key=due_key)
 
-        total_time, machines = self.dynamic_schedule(system, edd_selector_function)
+        total_time, machines = self.dynamic_schedule(system, edd_selector_function, job_key=due_key)
 
         return Schedule("EDD", total_time, machines)
@@ -1,3 +1,5 @@
+import heapq
+
 from .base import SchedulingAlgorithm
 from ..schedule import Schedule, MachineSchedule
 
@@ -5,6 +7,39 @@ class FCFSAlgorithm(SchedulingAlgorithm):
     '''
     first come first served
     '''
+    def prepare(self, system):
+        super().prepare(system)
+
+        # One heap per workcenter of (available_time, position, machine); the position
+        # keeps ties resolved in workcenter order, as min() over the machine list does
+        self.machine_heaps = {}
+        for workcenter in system.workcenters:
+            if workcenter.name not in self.machine_heaps:
+                heap = [
+                    (self.machine_available_time[machine.name], i, machine)
+                    for i, machine in enumerate(system.machines_for(workcenter.name))
+                ]
+                heapq.heapify(heap)
+                self.machine_heaps[workcenter.name] = heap
+
+    def _get_earliest_machine_for_workcenter(self, workcenter_name):
+        """
+        Returns the machine of the workcenter that becomes available the earliest.
+
+        Entries go stale when a machine is assigned work; since availability only
+        moves forward, a stale top entry is refreshed and sifted down until the top
+        is current, which makes it the true minimum.
+        """
+        heap = self.machine_heaps.get(workcenter_name)
+        if not heap:
+            raise ValueError(f"No machines available for workcenter {workcenter_name!r}")
+        while True:
+            available_time, i, machine = heap[0]
+            current_time = self.machine_available_time[machine.name]
+            if available_time == current_time:
+                return machine
+            heapq.heapreplace(heap, (current_time, i, machine))
+
     def schedule(self, system):
         self.prepare(system)
 
@@ -12,10 +47,9 @@ class FCFSAlgorithm(SchedulingAlgorithm):
 
         for job in sorted_jobs:
             for op in job.operations:
-                candidate_machines = self._get_machines_for_workcenter(system, op.workcenter)
-                chosen_machine = self._get_earliest_machine(candidate_machines)
+                chosen_machine = self._get_earliest_machine_for_workcenter(op.workcenter)
                 self._assign_single_operation(job, op, chosen_machine)
 
         machines_schedules = self.get_machine_schedules(system)
         total_time = max(self.machine_available_time.values()) if self.machine_available_time else 0
-        return Schedule("FCFS", total_time, machines_schedules)
\ No newline at end of file
+        return Schedule("FCFS", total_time, machines_schedules)
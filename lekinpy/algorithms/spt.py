@@ -1,3 +1,5 @@
+import math
+
 from .base import SchedulingAlgorithm
 from ..schedule import Schedule
 
@@ -6,12 +8,39 @@ class SPTAlgorithm(SchedulingAlgorithm):
     shortest processing time
     '''
     def schedule(self, system):
+        # Precompute each job's SPT value once instead of on every comparison
+        spt_keys = {
+            job: job.operations[0].processing_time if job.operations else math.inf
+            for job in system.jobs
+        }
+
         def spt_selector_function(jobs):
             """
             Custom SPT selection function that calculates the SPT value for a job.
             """
-            return min(jobs, key=lambda job: job.operations[0].processing_time if job.operations else float('inf'))
+            return min(jobs, key=spt_keys.__getitem__)
+
+        self.prepare(system)
+        if self.machine_available_time and self._all_jobs_released_at_start(system):
+            # Every job is available from the first decision point, so the dynamic
+            # loop reduces to a single sort by processing time: O(n log n) instead of O(n^2).
+            for job in sorted(system.jobs, key=spt_keys.__getitem__):
+                op = job.operations[0]
+                candidate_machines = self._get_machines_for_workcenter(system, op.workcenter)
+                chosen_machine = self._get_earliest_machine(candidate_machines)
+                self._assign_single_operation(job, op, chosen_machine)
+            machines = self.get_machine_schedules(system)
+            total_time = max(self.machine_available_time.values())
+        else:
+            total_time, machines = self.dynamic_schedule(
+                system, spt_selector_function, job_key=spt_keys.__getitem__
+            )
 
-        total_time, machines = self.dynamic_schedule(system, spt_selector_function)
+        return Schedule("SPT", total_time, machines)
 
-        return Schedule("SPT", total_time, machines)
\ No newline at end of file
+    def _all_jobs_released_at_start(self, system):
+        """
+        True if every job is released by the time the earliest machine becomes available.
+        """
+        start_time = min(self.machine_available_time.values())
+        return all(job.release <= start_time for job in system.jobs)
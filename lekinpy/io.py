@@ -36,6 +36,17 @@ def _parse_int_str(token: str, field: str) -> int:
     """
     return _coerce_int(token, field)
 
+class _LekinJSONEncoder(json.JSONEncoder):
+    """
+    Encodes lekinpy objects through their `to_dict()` as the encoder reaches them,
+    so json.dump can stream a system without first building the whole nested dict.
+    """
+    def default(self, o: Any) -> Any:
+        to_dict = getattr(o, 'to_dict', None)
+        if to_dict is not None:
+            return to_dict()
+        return super().default(o)
+
 def load_jobs_from_json(filepath: str) -> List[Job]:
     with open(filepath) as f:
         data = json.load(f)
@@ -253,11 +264,11 @@ def export_workcenters_to_mchfile(system: Any, filepath: str) -> None:
 
 def export_system_to_json(system: Any, filepath: str) -> None:
     system_dict = {
-        "jobs": [job.to_dict() for job in system.jobs],
-        "workcenters": [wc.to_dict() for wc in system.workcenters]
+        "jobs": system.jobs,
+        "workcenters": system.workcenters
     }
     try:
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(system_dict, f, indent=2)
+            json.dump(system_dict, f, indent=2, cls=_LekinJSONEncoder)
     except (OSError, TypeError, ValueError) as e:
         print(f"Error exporting system to JSON: {e}")
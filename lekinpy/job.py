@@ -1,30 +1,80 @@
-import random
+import sys
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
+from . import _config
+from ._colors import next_color
 
+_NUMERIC = (int, float)
+
+def _is_number(value: Any) -> bool:
+    # Exact-type membership is checked first; isinstance only runs for subclasses
+    return type(value) in _NUMERIC or isinstance(value, _NUMERIC)
+
+@dataclass(eq=False, repr=False)
 class Operation:
     ''' Represents a single operation step of a job: which workcenter it needs, how long it takes, and its status. '''
-    def __init__(self, workcenter: str, processing_time: float, status: str) -> None:
-        if not isinstance(workcenter, str):
-            raise TypeError("workcenter must be a string")
-        if not isinstance(processing_time, (int, float)):
-            raise TypeError("processing_time must be a number")
-        if not isinstance(status, str):
-            raise TypeError("status must be a string")
-        self.workcenter: str = workcenter
-        self.processing_time: float = float(processing_time)
-        self.status: str = status
+    # eq=False keeps identity comparison, which `job.operations.index(op)` relies on
+    __slots__ = ('workcenter', 'processing_time', 'status', 'start_time', 'end_time')
+
+    workcenter: str
+    processing_time: float
+    status: str
+
+    def __post_init__(self) -> None:
+        if _config.VALIDATE:
+            if not isinstance(self.workcenter, str):
+                raise TypeError("workcenter must be a string")
+            if not _is_number(self.processing_time):
+                raise TypeError("processing_time must be a number")
+            if not isinstance(self.status, str):
+                raise TypeError("status must be a string")
+        # Interned so the many workcenter-name comparisons and lookups hit identity first
+        self.workcenter = sys.intern(self.workcenter)
+        self.processing_time = float(self.processing_time)
 
     def __repr__(self) -> str:
         return f"Operation({self.workcenter}, {self.processing_time}, {self.status})"
 
+    @classmethod
+    def _from_dict_trusted(cls, data: Dict[str, Any]) -> 'Operation':
+        op = cls.__new__(cls)
+        op.workcenter = sys.intern(data['workcenter'])
+        op.processing_time = float(data['processing_time'])
+        op.status = data['status']
+        op._restore_times(data)
+        return op
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'Operation':
+        op = Operation(
+            workcenter=data['workcenter'],
+            processing_time=data['processing_time'],
+            status=data['status']
+        )
+        op._restore_times(data)
+        return op
+
+    def _restore_times(self, data: Dict[str, Any]) -> None:
+        # Timings are only present once an algorithm has scheduled the operation
+        for attr in ('start_time', 'end_time'):
+            if attr in data:
+                setattr(self, attr, data[attr])
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'workcenter': self.workcenter,
+            'processing_time': self.processing_time,
+            'status': self.status
+        }
+        for attr in ('start_time', 'end_time'):
+            value = getattr(self, attr, None)
+            if value is not None:
+                data[attr] = value
+        return data
+
 class Job:
     ''' Represents a schedulable job composed of one or more operations, with optional visualization color. '''
-    _available_colors: List[Tuple[int, int, int]] = [
-        (r, g, b) for r in range(0, 256, 64)
-        for g in range(0, 256, 64)
-        for b in range(0, 256, 64)
-    ]
-    random.shuffle(_available_colors)
+    __slots__ = ('job_id', 'release', 'due', 'weight', 'rgb', 'operations', 'first_op', 'start_time', 'end_time')
 
     def __init__(
         self,
@@ -35,24 +85,29 @@ class Job:
         operations: List[Operation],
         rgb: Optional[Tuple[int, int, int]] = None
     ) -> None:
-        if not isinstance(job_id, str):
-            raise TypeError("job_id must be a string")
-        if not isinstance(release, (int, float)):
-            raise TypeError("release must be a number")
-        if not isinstance(due, (int, float)):
-            raise TypeError("due must be a number")
-        if not isinstance(weight, (int, float)):
-            raise TypeError("weight must be a number")
-        if not isinstance(operations, list) or not all(isinstance(op, Operation) for op in operations):
-            raise TypeError("operations must be a list of Operation instances")
-        if rgb is not None and (not isinstance(rgb, tuple) or len(rgb) != 3 or not all(isinstance(c, int) for c in rgb)):
-            raise TypeError("rgb must be a tuple of three integers")
-        self.job_id: str = job_id
+        if _config.VALIDATE:
+            if not isinstance(job_id, str):
+                raise TypeError("job_id must be a string")
+            if not _is_number(release):
+                raise TypeError("release must be a number")
+            if not _is_number(due):
+                raise TypeError("due must be a number")
+            if not _is_number(weight):
+                raise TypeError("weight must be a number")
+            if not isinstance(operations, list) or not all(isinstance(op, Operation) for op in operations):
+                raise TypeError("operations must be a list of Operation instances")
+            if rgb is not None and (not isinstance(rgb, tuple) or len(rgb) != 3 or not all(isinstance(c, int) for c in rgb)):
+                raise TypeError("rgb must be a tuple of three integers")
+        self.job_id: str = sys.intern(job_id)
         self.release: float = float(release)
         self.due: float = float(due)
         self.weight: float = float(weight)
-        self.rgb: Tuple[int, int, int] = rgb if rgb else Job._available_colors.pop()
+        self.rgb: Tuple[int, int, int] = rgb if rgb else next_color()
         self.operations: List[Operation] = operations
+        # Shortcut for the first operation, which the display code reads per job. It is captured once:
+        # operations are treated as fixed after construction, and readers fall back to operations[0]
+        # when the job was created with an empty list and filled in later
+        self.first_op: Optional[Operation] = operations[0] if operations else None
 
     def __repr__(self) -> str:
         return (
@@ -63,8 +118,14 @@ class Job:
     # route should be a part of the job, but not included in this class
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Job':
-        operations = [Operation(**op) for op in data.get('operations', [])]
+    def from_dict(data: Dict[str, Any], trusted: bool = False) -> 'Job':
+        '''
+        Builds a job from its `to_dict()` form. With `trusted=True` type validation
+        is skipped entirely; use it only for input such as files written by lekinpy.
+        '''
+        if trusted:
+            return Job._from_dict_trusted(data)
+        operations = [Operation.from_dict(op) for op in data.get('operations', [])]
         return Job(
             job_id=data['job_id'],
             release=data['release'],
@@ -74,6 +135,24 @@ class Job:
             rgb=data.get('rgb')
         )
 
+    @staticmethod
+    def from_dict_fast(data: Dict[str, Any]) -> 'Job':
+        ''' Same as `from_dict(data, trusted=True)`. '''
+        return Job._from_dict_trusted(data)
+
+    @classmethod
+    def _from_dict_trusted(cls, data: Dict[str, Any]) -> 'Job':
+        job = cls.__new__(cls)
+        job.job_id = sys.intern(data['job_id'])
+        job.release = float(data['release'])
+        job.due = float(data['due'])
+        job.weight = float(data['weight'])
+        rgb = data.get('rgb')
+        job.rgb = tuple(rgb) if rgb else next_color()
+        job.operations = [Operation._from_dict_trusted(op) for op in data.get('operations', [])]
+        job.first_op = job.operations[0] if job.operations else None
+        return job
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'job_id': self.job_id,
@@ -81,5 +160,5 @@ class Job:
             'due': self.due,
             'weight': self.weight,
             'rgb': self.rgb,
-            'operations': [op.__dict__ for op in self.operations]
+            'operations': [op.to_dict() for op in self.operations]
         }
\ No newline at end of file
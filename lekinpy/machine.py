@@ -1,19 +1,25 @@
-import random
+import sys
 from typing import Any, Dict, List, Optional, Tuple
+from . import _config
+from ._colors import next_color
+from .job import _is_number
 
 class Machine:
     ''' 
     Represents a single processing resource that can execute operations. 
     A `Machine` has a name, a release time (availability), and a status. 
     '''
+    __slots__ = ('name', 'release', 'status')
+
     def __init__(self, name: str, release: float, status: str) -> None:
-        if not isinstance(name, str):
-            raise TypeError("name must be a string")
-        if not isinstance(release, (int, float)):
-            raise TypeError("release must be a number")
-        if not isinstance(status, str):
-            raise TypeError("status must be a string")
-        self.name: str = name
+        if _config.VALIDATE:
+            if not isinstance(name, str):
+                raise TypeError("name must be a string")
+            if not _is_number(release):
+                raise TypeError("release must be a number")
+            if not isinstance(status, str):
+                raise TypeError("status must be a string")
+        self.name: str = sys.intern(name)
         self.release: float = float(release)
         self.status: str = status
 
@@ -23,13 +29,23 @@ class Machine:
     # speed of the machine is not included in this class
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Machine':
+    def from_dict(data: Dict[str, Any], trusted: bool = False) -> 'Machine':
+        if trusted:
+            return Machine._from_dict_trusted(data)
         return Machine(
             name=data['name'],
             release=data['release'],
             status=data['status']
         )
 
+    @classmethod
+    def _from_dict_trusted(cls, data: Dict[str, Any]) -> 'Machine':
+        machine = cls.__new__(cls)
+        machine.name = sys.intern(data['name'])
+        machine.release = float(data['release'])
+        machine.status = data['status']
+        return machine
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'name': self.name,
@@ -42,12 +58,7 @@ class Workcenter:
     A group of one or more `Machine` instances that compete to process operations. 
     Each workcenter can have an RGB color for visualization. 
     '''
-    _available_colors: List[Tuple[int, int, int]] = [
-        (r, g, b) for r in range(0, 256, 64)
-        for g in range(0, 256, 64)
-        for b in range(0, 256, 64)
-    ]
-    random.shuffle(_available_colors)
+    __slots__ = ('name', 'release', 'status', 'rgb', 'machines')
 
     def __init__(
         self,
@@ -57,20 +68,21 @@ class Workcenter:
         machines: List[Machine],
         rgb: Optional[Tuple[int, int, int]] = None
     ) -> None:
-        if not isinstance(name, str):
-            raise TypeError("name must be a string")
-        if not isinstance(release, (int, float)):
-            raise TypeError("release must be a number")
-        if not isinstance(status, str):
-            raise TypeError("status must be a string")
-        if not isinstance(machines, list) or not all(isinstance(m, Machine) for m in machines):
-            raise TypeError("machines must be a list of Machine instances")
-        if rgb is not None and (not isinstance(rgb, tuple) or len(rgb) != 3 or not all(isinstance(c, int) for c in rgb)):
-            raise TypeError("rgb must be a tuple of three integers")
-        self.name: str = name
+        if _config.VALIDATE:
+            if not isinstance(name, str):
+                raise TypeError("name must be a string")
+            if not _is_number(release):
+                raise TypeError("release must be a number")
+            if not isinstance(status, str):
+                raise TypeError("status must be a string")
+            if not isinstance(machines, list) or not all(isinstance(m, Machine) for m in machines):
+                raise TypeError("machines must be a list of Machine instances")
+            if rgb is not None and (not isinstance(rgb, tuple) or len(rgb) != 3 or not all(isinstance(c, int) for c in rgb)):
+                raise TypeError("rgb must be a tuple of three integers")
+        self.name: str = sys.intern(name)
         self.release: float = float(release)
         self.status: str = status
-        self.rgb: Tuple[int, int, int] = rgb if rgb else Workcenter._available_colors.pop()
+        self.rgb: Tuple[int, int, int] = rgb if rgb else next_color()
         self.machines: List[Machine] = machines
 
     def __repr__(self) -> str:
@@ -78,7 +90,13 @@ class Workcenter:
                 f"{self.rgb}, {self.machines})")
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'Workcenter':
+    def from_dict(data: Dict[str, Any], trusted: bool = False) -> 'Workcenter':
+        '''
+        Builds a workcenter and its machines from their `to_dict()` form. With
+        `trusted=True` type validation is skipped; use it only for known-good input.
+        '''
+        if trusted:
+            return Workcenter._from_dict_trusted(data)
         machines = [Machine.from_dict(m) for m in data.get('machines', [])]
         return Workcenter(
             name=data['name'],
@@ -88,6 +106,17 @@ class Workcenter:
             machines=machines
         )
 
+    @classmethod
+    def _from_dict_trusted(cls, data: Dict[str, Any]) -> 'Workcenter':
+        wc = cls.__new__(cls)
+        wc.name = sys.intern(data['name'])
+        wc.release = float(data['release'])
+        wc.status = data['status']
+        rgb = data['rgb']
+        wc.rgb = tuple(rgb) if rgb else next_color()
+        wc.machines = [Machine._from_dict_trusted(m) for m in data.get('machines', [])]
+        return wc
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'name': self.name,
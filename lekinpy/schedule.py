@@ -1,11 +1,19 @@
+import sys
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+@dataclass(eq=False)
 class MachineSchedule:
     ''' Represents the list of jobs assigned to a specific machine within a workcenter. '''
-    def __init__(self, workcenter: Optional[str], machine: str, operations: List[str]) -> None:
-        self.workcenter: Optional[str] = workcenter
-        self.machine: str = machine
-        self.operations: List[str] = operations  # List of job_ids
+    __slots__ = ('workcenter', 'machine', 'operations')
+
+    workcenter: Optional[str]
+    machine: str
+    operations: List[str]  # List of job_ids
+
+    def __post_init__(self) -> None:
+        self.machine = sys.intern(self.machine)
+        self.operations = [sys.intern(job_id) for job_id in self.operations]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -14,12 +22,15 @@ class MachineSchedule:
             'operations': self.operations
         }
 
+@dataclass(eq=False)
 class Schedule:
     ''' Represents a full scheduling result across machines, including display and plotting utilities. '''
-    def __init__(self, schedule_type: str, time: int, machines: List[MachineSchedule]) -> None:
-        self.schedule_type: str = schedule_type
-        self.time: int = time
-        self.machines: List[MachineSchedule] = machines
+    # `rgb` is not a field; callers exporting to .seq set it before save_schedule_to_seq
+    __slots__ = ('schedule_type', 'time', 'machines', 'rgb')
+
+    schedule_type: str
+    time: int
+    machines: List[MachineSchedule]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -44,41 +55,49 @@ class Schedule:
             print(f"{ms.machine}: {ms.operations}")
 
     def display_job_details(self, system: Any) -> None:
-        print("\nDetailed Job Schedule:")
-        print(f"{'ID':<6} {'Wght':<5} {'Rls':<4} {'Due':<4} {'Pr.tm.':<7} {'Stat.':<6} {'Bgn':<4} {'End':<4} {'T':<4} {'wT':<4}")
-        job_timings: Dict[str, Tuple[int, int]] = {}
-
-        # Collect timings per job from the schedule, respecting job release time
+        # Rows are collected and written to stdout in one call
+        rows = [
+            "\nDetailed Job Schedule:",
+            f"{'ID':<6} {'Wght':<5} {'Rls':<4} {'Due':<4} {'Pr.tm.':<7} {'Stat.':<6} {'Bgn':<4} {'End':<4} {'T':<4} {'wT':<4}",
+        ]
+        job_by_id = {j.job_id: j for j in system.jobs}
+        job_rows: Dict[str, str] = {}
+
+        # Compute each job's timing from the schedule, respecting job release time, and format its
+        # row straight away; a job listed on several machines keeps its first position but its last
+        # timing, since a later occurrence overwrites the pending row
         for ms in self.machines:
             machine_time = 0  # assuming scheduling starts at time 1
             for job_id in ms.operations:
-                job = next(j for j in system.jobs if j.job_id == job_id)
-                release = job.release
-                duration = job.operations[0].processing_time
-                start_time = max(release, machine_time)
-                end_time = start_time + duration
-                job_timings[job_id] = (start_time, end_time)
-                machine_time = end_time
+                job = job_by_id[job_id]
+                first_op = job.first_op or job.operations[0]
+                duration = first_op.processing_time
+                bgn = max(job.release, machine_time)
+                end = bgn + duration
+                machine_time = end
+                T = end - job.due  # If this is negative this is zero
+                T = max(T, 0)  # Ensure T is not negative
+                wT = T * job.weight
+                job_rows[job_id] = f"{job_id:<6} {job.weight:<5} {job.release:<4} {job.due:<4} {duration:<7} {first_op.status:<6} {bgn:<4} {end:<4} {T:<4} {wT:<4}"
+        rows.extend(job_rows.values())
 
+        # Jobs missing from the schedule are listed last with blank timing columns
         for job in system.jobs:
-            job_id = job.job_id
-            weight = job.weight
-            release = job.release
-            due = job.due
-            duration = job.operations[0].processing_time
-            status = job.operations[0].status
-            bgn, end = job_timings.get(job_id, (None, None))
-            if bgn is not None:
-                T = end - due  # If this is negative this is zero
-                T = max(T, 0)  # Ensure T is not negative
-                wT = T * weight
-                print(f"{job_id:<6} {weight:<5} {release:<4} {due:<4} {duration:<7} {status:<6} {bgn:<4} {end:<4} {T:<4} {wT:<4}")
+            if job.job_id not in job_rows:
+                first_op = job.first_op or job.operations[0]
+                rows.append(f"{job.job_id:<6} {job.weight:<5} {job.release:<4} {job.due:<4} {first_op.processing_time:<7} {first_op.status:<6} {'':<4} {'':<4} {'':<4} {'':<4}")
 
-    def plot_gantt_chart(self, system: Any) -> None:
+        sys.stdout.write('\n'.join(rows) + '\n')
+
+    def plot_gantt_chart(self, system: Any, show_labels: bool = True) -> None:
         import matplotlib.pyplot as plt
+        from matplotlib.colors import to_rgba_array
 
         fig, ax = plt.subplots(figsize=(10, 4))
-        colors = {job.job_id: f"C{i}" for i, job in enumerate(system.jobs)}
+        jobs = system.jobs
+        job_index = {job.job_id: i for i, job in enumerate(jobs)}
+        # Resolve every job's color to RGBA once; rows are picked per machine by job index
+        job_colors = to_rgba_array([f"C{i}" for i in range(len(jobs))])
 
         yticks: List[int] = []
         yticklabels: List[str] = []
@@ -87,16 +106,24 @@ class Schedule:
             y = i
             yticks.append(y)
             yticklabels.append(ms.machine)
+            # Collect every bar on this machine and draw them as one collection
+            segments: List[Tuple[float, float]] = []
+            indices = [job_index[job_id] for job_id in ms.operations]
             machine_time = 0
-            for job_id in ms.operations:
-                job = next(j for j in system.jobs if j.job_id == job_id)
+            for j in indices:
+                job = jobs[j]
                 release = job.release
-                duration = job.operations[0].processing_time
+                duration = (job.first_op or job.operations[0]).processing_time
                 start_time = max(release, machine_time)
                 end_time = start_time + duration
-                ax.barh(y, duration, left=start_time, color=colors.get(job_id, 'gray'), edgecolor='black')
-                ax.text(start_time + duration / 2, y, job_id, ha='center', va='center', color='white', fontsize=10)
+                segments.append((start_time, duration))
                 machine_time = end_time
+            if not segments:
+                continue
+            ax.broken_barh(segments, (y - 0.4, 0.8), facecolors=job_colors[indices], edgecolor='black')
+            if show_labels:
+                for (start_time, duration), job_id in zip(segments, ms.operations):
+                    ax.text(start_time + duration / 2, y, job_id, ha='center', va='center', color='white', fontsize=10)
 
         ax.set_yticks(yticks)
         ax.set_yticklabels(yticklabels)
@@ -107,46 +134,52 @@ class Schedule:
         plt.show()
 
     def display_sequence(self, system: Any) -> None:
-        print("\nJob Sequence per Machine:")
-        print(f"{'Mch/Job':<8} {'Setup':<6} {'Start':<6} {'Stop':<6} {'Pr.tm.':<6}")
+        rows = [
+            "\nJob Sequence per Machine:",
+            f"{'Mch/Job':<8} {'Setup':<6} {'Start':<6} {'Stop':<6} {'Pr.tm.':<6}",
+        ]
+        job_by_id = {j.job_id: j for j in system.jobs}
         for ms in self.machines:
-            print(f"{ms.machine:<8}")
+            rows.append(f"{ms.machine:<8}")
             time_marker = 0
             for job_id in ms.operations:
-                job = next(j for j in system.jobs if j.job_id == job_id)
-                pr_tm = job.operations[0].processing_time
+                job = job_by_id[job_id]
+                pr_tm = (job.first_op or job.operations[0]).processing_time
                 setup = 0  # assuming 0 setup time
                 start = time_marker
                 stop = start + pr_tm
-                print(f"  {job_id:<6} {setup:<6} {start:<6} {stop:<6} {pr_tm:<6}")
+                rows.append(f"  {job_id:<6} {setup:<6} {start:<6} {stop:<6} {pr_tm:<6}")
                 time_marker = stop
 
-    def display_summary(self, system: Any) -> None:
-        start_times, end_times, T_list, wT_list, C_list, wC_list, U_list = [], [], [], [], [], [], []
+        sys.stdout.write('\n'.join(rows) + '\n')
 
-        for job in system.jobs:
-            start = getattr(job, 'start_time', None)
-            end = getattr(job, 'end_time', None)
-            due = job.due
-            weight = job.weight
-            if start is not None and end is not None:
-                T = max(0, end - due)
-                T_list.append(T)
-                wT_list.append(T * weight)
-                C_list.append(end)
-                wC_list.append(end * weight)
-                start_times.append(start)
-                end_times.append(end)
-                U_list.append(1 if T > 0 else 0)
-
-        time_start = min(start_times) if start_times else 0
-        C_max = max(end_times) if end_times else 0
-        T_max = max(T_list) if T_list else 0
-        U = sum(U_list)
-        sum_Cj = sum(C_list)
-        sum_Tj = sum(T_list)
-        sum_wCj = sum(wC_list)
-        sum_wTj = sum(wT_list)
+    def display_summary(self, system: Any) -> None:
+        import numpy as np
+
+        jobs = system.jobs
+        n = len(jobs)
+        starts = np.fromiter((getattr(j, 'start_time', np.nan) for j in jobs), dtype=np.float64, count=n)
+        ends = np.fromiter((getattr(j, 'end_time', np.nan) for j in jobs), dtype=np.float64, count=n)
+        dues = np.fromiter((j.due for j in jobs), dtype=np.float64, count=n)
+        weights = np.fromiter((j.weight for j in jobs), dtype=np.float64, count=n)
+
+        # Only jobs that were actually scheduled contribute to the summary
+        valid = ~np.isnan(starts) & ~np.isnan(ends)
+        starts, ends, dues, weights = starts[valid], ends[valid], dues[valid], weights[valid]
+        T = np.maximum(0.0, ends - dues)
+
+        if ends.size:
+            time_start = float(starts.min())
+            C_max = float(ends.max())
+            U = int(np.count_nonzero(T > 0))
+            # With no late job the list/sum path printed the int 0 here, so keep that
+            T_max = float(T.max()) if U else 0
+            sum_Cj = float(ends.sum())
+            sum_Tj = float(T.sum()) if U else 0
+            sum_wCj = float((ends * weights).sum())
+            sum_wTj = float((T * weights).sum())
+        else:
+            time_start = C_max = T_max = U = sum_Cj = sum_Tj = sum_wCj = sum_wTj = 0
 
         print("\nSummary:")
         print(f"{'Time':<10}{time_start}")
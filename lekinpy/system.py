@@ -1,7 +1,9 @@
 from .job import Job
 from .machine import Machine, Workcenter
 from .schedule import Schedule
-from typing import Any, Dict, List, Optional
+from .io import _LekinJSONEncoder
+import json
+from typing import IO, Any, Dict, List, Optional
 
 class System:
     ''' Represents the complete scheduling environment, holding jobs, workcenters, and an optional computed schedule. '''
@@ -9,6 +11,10 @@ class System:
         self.jobs: List[Job] = []
         self.workcenters: List[Workcenter] = []
         self.schedule: Optional[Schedule] = None
+        # Lookup indexes derived from workcenters, built lazily and reset by add_workcenter
+        self._machines_by_workcenter: Optional[Dict[str, List[Machine]]] = None
+        self._workcenter_by_machine: Optional[Dict[str, str]] = None
+        self._machines_cache: Optional[List[Machine]] = None
 
     def add_job(self, job: Job) -> None:
         if not isinstance(job, Job):
@@ -19,6 +25,7 @@ class System:
         if not isinstance(workcenter, Workcenter):
             raise TypeError("workcenter must be a Workcenter instance")
         self.workcenters.append(workcenter)
+        self.invalidate_indexes()
 
     def set_schedule(self, schedule: Schedule) -> None:
         if not isinstance(schedule, Schedule):
@@ -27,10 +34,46 @@ class System:
 
     @property
     def machines(self) -> List[Machine]:
-        all_machines: List[Machine] = []
+        '''
+        Flat list of every machine across all workcenters, cached until the next add_workcenter.
+        Changing workcenters or their machines directly (`system.workcenters.append`, reassigning
+        `system.workcenters`, `wc.machines.append`, ...) bypasses this cache and the workcenter
+        indexes; call `invalidate_indexes()` afterwards in that case.
+        '''
+        if self._machines_cache is None:
+            all_machines: List[Machine] = []
+            for wc in self.workcenters:
+                all_machines.extend(wc.machines)
+            self._machines_cache = all_machines
+        return self._machines_cache
+
+    def invalidate_indexes(self) -> None:
+        ''' Drops the cached machine list and workcenter indexes; they are rebuilt on next use. '''
+        self._machines_by_workcenter = None
+        self._machines_cache = None
+        self._workcenter_by_machine = None
+
+    def _build_indexes(self) -> None:
+        machines_by_workcenter: Dict[str, List[Machine]] = {}
+        workcenter_by_machine: Dict[str, str] = {}
         for wc in self.workcenters:
-            all_machines.extend(wc.machines)
-        return all_machines
+            machines_by_workcenter.setdefault(wc.name, []).extend(wc.machines)
+            for m in wc.machines:
+                workcenter_by_machine[m.name] = wc.name
+        self._machines_by_workcenter = machines_by_workcenter
+        self._workcenter_by_machine = workcenter_by_machine
+
+    def machines_for(self, workcenter_name: str) -> List[Machine]:
+        ''' Returns the machines belonging to the named workcenter (empty list if unknown). '''
+        if self._machines_by_workcenter is None:
+            self._build_indexes()
+        return self._machines_by_workcenter.get(workcenter_name, [])
+
+    def workcenter_for(self, machine_name: str) -> Optional[str]:
+        ''' Returns the name of the workcenter owning the named machine, or None. '''
+        if self._workcenter_by_machine is None:
+            self._build_indexes()
+        return self._workcenter_by_machine.get(machine_name)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -38,3 +81,14 @@ class System:
             'workcenters': [wc.to_dict() for wc in self.workcenters],
             'schedule': self.schedule.to_dict() if self.schedule else None
         }
+
+    def write_json(self, fp: IO[str], indent: Optional[int] = None) -> None:
+        '''
+        Writes the same document as `to_dict()` to an open text file, converting
+        jobs and workcenters one at a time instead of building the full dict first.
+        '''
+        json.dump({
+            'jobs': self.jobs,
+            'workcenters': self.workcenters,
+            'schedule': self.schedule
+        }, fp, indent=indent, cls=_LekinJSONEncoder)
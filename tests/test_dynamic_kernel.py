@@ -0,0 +1,27 @@
+import random
+from lekinpy import System, Job, Operation, Machine, Workcenter, EDDAlgorithm, SPTAlgorithm
+from lekinpy.algorithms import _kernels
+
+def _system(seed):
+    rng = random.Random(seed)
+    system = System()
+    for w in range(2):
+        system.add_workcenter(Workcenter(f"W{w}", 0, "A", [Machine(f"W{w}.{k}", rng.randint(0, 4), "A") for k in range(w + 1)]))
+    for j in range(12):
+        system.add_job(Job(f"J{j}", rng.randint(0, 15), rng.randint(5, 30), 1, [Operation(f"W{rng.randrange(2)}", rng.randint(1, 5), "A")]))
+    return system
+
+def test_kernel_matches_python_loop(monkeypatch):
+    # Run the kernel uncompiled so the test does not depend on numba being installed
+    monkeypatch.setattr(_kernels, "compiled_dynamic_schedule_kernel", lambda: _kernels.dynamic_schedule_kernel)
+    for algorithm in (EDDAlgorithm, SPTAlgorithm):
+        for seed in range(20):
+            expected_system = _system(seed)
+            expected = algorithm().schedule(expected_system)
+            actual_system = _system(seed)
+            forced = algorithm()
+            forced.compiled_min_jobs = 0
+            actual = forced.schedule(actual_system)
+            assert actual.to_dict() == expected.to_dict()
+            assert [(j.start_time, j.end_time) for j in actual_system.jobs] == \
+                [(j.start_time, j.end_time) for j in expected_system.jobs]
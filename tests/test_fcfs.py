@@ -0,0 +1,12 @@
+from lekinpy import System, Job, Operation, Machine, Workcenter, FCFSAlgorithm
+
+def test_fcfs_uses_earliest_free_machine_in_workcenter_order():
+    system = System()
+    system.add_workcenter(Workcenter("W01", 0, "A", [Machine("A1", 0, "A"), Machine("A2", 0, "A")]))
+    system.add_job(Job("J1", 0, 10, 1, [Operation("W01", 4, "A")]))
+    system.add_job(Job("J2", 0, 10, 1, [Operation("W01", 2, "A")]))
+    system.add_job(Job("J3", 1, 10, 1, [Operation("W01", 3, "A")]))
+    system.add_job(Job("J4", 1, 10, 1, [Operation("W01", 1, "A")]))
+    schedule = FCFSAlgorithm().schedule(system)
+    assert [ms.operations for ms in schedule.machines] == [["J1", "J4"], ["J2", "J3"]]
+    assert schedule.time == 5
@@ -0,0 +1,39 @@
+from lekinpy import Job, Operation, Machine, Workcenter
+
+def test_from_dict_fast_matches_from_dict():
+    job = Job("J1", 0, 10, 2, [Operation("W01", 5, "A"), Operation("W02", 3, "B")], rgb=(0, 64, 128))
+    data = job.to_dict()
+    fast = Job.from_dict_fast(data)
+    assert fast.to_dict() == Job.from_dict(data).to_dict() == data
+    assert isinstance(fast.operations[0], Operation)
+
+def test_trusted_from_dict_skips_validation():
+    data = {"job_id": "J1", "release": "0", "due": 10, "weight": 1,
+            "operations": [{"workcenter": "W01", "processing_time": 5, "status": "A"}]}
+    try:
+        Job.from_dict(data)
+        assert False, "expected TypeError"
+    except TypeError:
+        pass
+    job = Job.from_dict(data, trusted=True)
+    assert job.release == 0.0
+    assert job.first_op is job.operations[0]
+
+def test_trusted_workcenter_from_dict_round_trips():
+    wc = Workcenter("W01", 0, "A", [Machine("A1", 0, "A"), Machine("A2", 1, "B")], rgb=(0, 64, 128))
+    data = wc.to_dict()
+    assert Workcenter.from_dict(data, trusted=True).to_dict() == Workcenter.from_dict(data).to_dict() == data
+
+def test_to_dict_keeps_operation_timings_after_scheduling():
+    from lekinpy import System, FCFSAlgorithm
+    system = System()
+    system.add_workcenter(Workcenter("W1", 0, "A", [Machine("A1", 0, "A")]))
+    system.add_job(Job("J1", 0, 10, 1, [Operation("W1", 3, "A")]))
+    assert system.jobs[0].to_dict()['operations'] == [{'workcenter': 'W1', 'processing_time': 3.0, 'status': 'A'}]
+    FCFSAlgorithm().schedule(system)
+    data = system.jobs[0].to_dict()
+    assert data['operations'] == [
+        {'workcenter': 'W1', 'processing_time': 3.0, 'status': 'A', 'start_time': 0.0, 'end_time': 3.0}
+    ]
+    for loaded in (Job.from_dict(data), Job.from_dict(data, trusted=True)):
+        assert loaded.to_dict() == data
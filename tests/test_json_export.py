@@ -0,0 +1,28 @@
+import io
+import json
+from pathlib import Path
+from lekinpy import System, Job, Operation, Machine, Workcenter, FCFSAlgorithm, export_system_to_json
+
+def _system():
+    system = System()
+    system.add_workcenter(Workcenter("W01", 0, "A", [Machine("A1", 0, "A")], rgb=(0, 0, 0)))
+    system.add_job(Job("J1", 0, 10, 1, [Operation("W01", 5, "A")], rgb=(255, 0, 0)))
+    system.add_job(Job("J2", 1, 8, 2, [Operation("W01", 2, "A")], rgb=(0, 255, 0)))
+    return system
+
+def test_write_json_matches_to_dict():
+    system = _system()
+    system.set_schedule(FCFSAlgorithm().schedule(system))
+    buf = io.StringIO()
+    system.write_json(buf, indent=2)
+    assert buf.getvalue() == json.dumps(system.to_dict(), indent=2)
+
+def test_export_system_to_json_round_trips(tmp_path: Path):
+    system = _system()
+    path = tmp_path / "system.json"
+    export_system_to_json(system, str(path))
+    expected = {
+        "jobs": [j.to_dict() for j in system.jobs],
+        "workcenters": [wc.to_dict() for wc in system.workcenters],
+    }
+    assert path.read_text() == json.dumps(expected, indent=2)
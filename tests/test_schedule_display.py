@@ -0,0 +1,63 @@
+from lekinpy import System, Job, Operation, Machine, Workcenter, Schedule, MachineSchedule, FCFSAlgorithm
+
+def test_job_details_report_last_occurrence(capsys):
+    system = System()
+    system.add_workcenter(Workcenter("W1", 0, "A", [Machine("A1", 0, "A")]))
+    system.add_workcenter(Workcenter("W2", 0, "A", [Machine("B1", 0, "A")]))
+    system.add_job(Job("J1", 1, 3, 1, [Operation("W1", 2, "A"), Operation("W2", 2, "A")]))
+    system.add_job(Job("J2", 0, 9, 1, [Operation("W2", 3, "A")]))
+    system.add_job(Job("J3", 0, 9, 1, [Operation("W1", 1, "A")]))
+    schedule = Schedule("X", 5, [
+        MachineSchedule("W1", "A1", ["J1"]),
+        MachineSchedule("W2", "B1", ["J2", "J1"]),
+    ])
+    schedule.display_job_details(system)
+    rows = [line.split() for line in capsys.readouterr().out.splitlines()[3:]]
+    # J1 keeps its first position but reports its timing on B1 (3-5, two late)
+    assert rows[0] == ["J1", "1.0", "1.0", "3.0", "2.0", "A", "3.0", "5.0", "2.0", "2.0"]
+    assert rows[1][0] == "J2"
+    # Unscheduled jobs come last with blank timings
+    assert rows[2] == ["J3", "1.0", "0.0", "9.0", "1.0", "A"]
+
+def _summary(capsys, due):
+    system = System()
+    system.add_workcenter(Workcenter("W1", 0, "A", [Machine("A1", 0, "A")]))
+    system.add_job(Job("J1", 0, 10, 1, [Operation("W1", 3, "A")]))
+    system.add_job(Job("J2", 0, due, 2, [Operation("W1", 4, "A")]))
+    schedule = FCFSAlgorithm().schedule(system)
+    capsys.readouterr()
+    schedule.display_summary(system)
+    return [line.split() for line in capsys.readouterr().out.splitlines()[2:]]
+
+def test_summary_on_time(capsys):
+    # No late job: T_max and ΣT_j print the int 0, ΣwT_j the float 0.0
+    assert _summary(capsys, 10) == [
+        ["Time", "0.0"], ["C_max", "7.0"], ["T_max", "0"], ["ΣU_j", "0"],
+        ["ΣC_j", "10.0"], ["ΣT_j", "0"], ["ΣwC_j", "17.0"], ["ΣwT_j", "0.0"],
+    ]
+
+def test_summary_with_late_job(capsys):
+    assert _summary(capsys, 5) == [
+        ["Time", "0.0"], ["C_max", "7.0"], ["T_max", "2.0"], ["ΣU_j", "1"],
+        ["ΣC_j", "10.0"], ["ΣT_j", "2.0"], ["ΣwC_j", "17.0"], ["ΣwT_j", "4.0"],
+    ]
+
+def test_summary_without_scheduled_jobs(capsys):
+    system = System()
+    system.add_job(Job("J1", 0, 10, 1, [Operation("W1", 3, "A")]))
+    Schedule("X", 0, []).display_summary(system)
+    values = [line.split()[1] for line in capsys.readouterr().out.splitlines()[2:]]
+    assert values == ["0"] * 8
+
+def test_display_handles_operations_appended_after_construction(capsys):
+    system = System()
+    system.add_workcenter(Workcenter("W1", 0, "A", [Machine("A1", 0, "A")]))
+    job = Job("J1", 0, 10, 1, [])
+    job.operations.append(Operation("W1", 3, "A"))
+    system.add_job(job)
+    schedule = FCFSAlgorithm().schedule(system)
+    schedule.display_job_details(system)
+    schedule.display_sequence(system)
+    out = capsys.readouterr().out
+    assert "J1     1.0   0.0  10.0 3.0     A      0.0  3.0  0    0.0" in out
+    assert "  J1     0      0      3.0    3.0   " in out
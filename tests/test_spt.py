@@ -0,0 +1,18 @@
+from lekinpy import System, Job, Operation, Machine, Workcenter, SPTAlgorithm
+
+def _system(releases):
+    system = System()
+    system.add_workcenter(Workcenter("W01", 0, "A", [Machine("A1", 0, "A")]))
+    for i, (release, pt) in enumerate(zip(releases, [7, 2, 5])):
+        system.add_job(Job(f"J{i}", release, 20, 1, [Operation("W01", pt, "A")]))
+    return system
+
+def test_spt_orders_by_processing_time_when_all_released():
+    schedule = SPTAlgorithm().schedule(_system([0, 0, 0]))
+    assert schedule.machines[0].operations == ["J1", "J2", "J0"]
+    assert schedule.time == 14
+
+def test_spt_respects_release_times():
+    schedule = SPTAlgorithm().schedule(_system([0, 3, 0]))
+    assert schedule.machines[0].operations == ["J2", "J1", "J0"]
+    assert schedule.time == 14
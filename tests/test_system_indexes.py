@@ -0,0 +1,29 @@
+from lekinpy import System, Machine, Workcenter
+
+def test_machines_for_tracks_added_workcenters():
+    system = System()
+    system.add_workcenter(Workcenter("W01", 0, "A", [Machine("A1", 0, "A"), Machine("A2", 0, "A")]))
+    assert [m.name for m in system.machines_for("W01")] == ["A1", "A2"]
+    assert system.machines_for("W02") == []
+    system.add_workcenter(Workcenter("W02", 0, "A", [Machine("B1", 0, "A")]))
+    assert [m.name for m in system.machines_for("W02")] == ["B1"]
+    assert system.workcenter_for("B1") == "W02"
+    assert system.workcenter_for("missing") is None
+
+def test_machines_cache_refreshes_on_add_workcenter():
+    system = System()
+    system.add_workcenter(Workcenter("W01", 0, "A", [Machine("A1", 0, "A")]))
+    assert system.machines is system.machines
+    system.add_workcenter(Workcenter("W02", 0, "A", [Machine("B1", 0, "A")]))
+    assert [m.name for m in system.machines] == ["A1", "B1"]
+
+def test_invalidate_indexes_picks_up_direct_mutation():
+    system = System()
+    wc = Workcenter("W01", 0, "A", [Machine("A1", 0, "A")])
+    system.add_workcenter(wc)
+    assert [m.name for m in system.machines] == ["A1"]
+    wc.machines.append(Machine("A2", 0, "A"))
+    system.workcenters.append(Workcenter("W02", 0, "A", [Machine("B1", 0, "A")]))
+    system.invalidate_indexes()
+    assert [m.name for m in system.machines] == ["A1", "A2", "B1"]
+    assert system.workcenter_for("B1") == "W02"